@@ -2,16 +2,94 @@
 Data loading and preprocessing utilities for Brent oil price analysis.
 """
 
+import json
+import os
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from typing import Optional, Tuple
 from pathlib import Path
 
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` when numba isn't installed."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        
+        def decorator(func):
+            return func
+        return decorator
+
+try:
+    import bottleneck as bn
+    _BOTTLENECK_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _BOTTLENECK_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    _PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _PYARROW_AVAILABLE = False
+
+# Arrow schema metadata key under which prepare_modeling_data stores the
+# inputs a Parquet cache was built from
+_PARQUET_CACHE_KEY = b'prepare_modeling_data'
+
+# Brent quotes carry ~5 significant digits, so float32 loses nothing and
+# halves the memory traffic of every pass over the prices
+_PRICE_CSV_DTYPES = {'Date': str, 'Price': np.float32}
+
+
+def _index_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Validate raw price rows, parse their dates and index them by Date.
+    
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Raw CSV rows with string 'Date' and numeric 'Price' columns
+        
+    Returns
+    -------
+    pd.DataFrame
+        Chronologically sorted DataFrame with Date index
+        
+    Raises
+    ------
+    ValueError
+        If the data format is invalid
+    """
+    # Validate columns
+    if 'Date' not in df.columns or 'Price' not in df.columns:
+        raise ValueError("CSV must contain 'Date' and 'Price' columns")
+    
+    # Arrow can't parse custom date formats; cache decodes each unique date once
+    df['Date'] = pd.to_datetime(df['Date'], format='%d-%b-%y', cache=True)
+    
+    # Sort only when the rows aren't already chronological; sorting the index
+    # directly avoids the extra copy of sort_values + reset_index
+    df.set_index('Date', inplace=True)
+    if not df.index.is_monotonic_increasing:
+        df.sort_index(inplace=True)
+    
+    return df
+
 
 def load_brent_prices(file_path: str) -> pd.DataFrame:
     """
     Load Brent oil prices from CSV file.
     
+    Parsed files are cached by path, modification time and size, so
+    repeated loads of an unchanged file skip the CSV parse.
+    
     Parameters
     ----------
     file_path : str
@@ -20,7 +98,9 @@ def load_brent_prices(file_path: str) -> pd.DataFrame:
     Returns
     -------
     pd.DataFrame
-        DataFrame with Date index and Price column
+        DataFrame with Date index and float32 Price column. Cast with
+        ``.astype(np.float64)`` before handing prices to models that
+        require double precision.
         
     Raises
     ------
@@ -29,27 +109,48 @@ def load_brent_prices(file_path: str) -> pd.DataFrame:
     ValueError
         If the data format is invalid
     """
-    if not Path(file_path).exists():
+    path = Path(file_path)
+    if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    df = pd.read_csv(file_path)
-    
-    # Validate columns
-    if 'Date' not in df.columns or 'Price' not in df.columns:
-        raise ValueError("CSV must contain 'Date' and 'Price' columns")
+    # Copy so callers can't mutate the cached frame
+    stat = path.stat()
+    return _load_brent_prices_cached(
+        str(path.resolve()), stat.st_mtime_ns, stat.st_size
+    ).copy()
+
+
+@lru_cache(maxsize=8)
+def _load_brent_prices_cached(file_path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """
+    Parse a Brent price CSV, memoized on path, modification time and size.
     
-    # Convert date and set as index
-    df['Date'] = pd.to_datetime(df['Date'], format='%d-%b-%y')
-    df = df.sort_values('Date').reset_index(drop=True)
-    df.set_index('Date', inplace=True)
+    ``mtime_ns`` and ``size`` only form part of the cache key, so an edited
+    file is re-read.
+    """
+    if _PYARROW_AVAILABLE:
+        # Multi-threaded Arrow tokenizer reading in 1 MiB blocks
+        table = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(block_size=1 << 20),
+            convert_options=pacsv.ConvertOptions(
+                column_types={'Date': pa.string(), 'Price': pa.float32()}
+            )
+        )
+        df = table.to_pandas()
+    else:
+        df = pd.read_csv(file_path, dtype=_PRICE_CSV_DTYPES)
     
-    return df
+    return _index_by_date(df)
 
 
 def load_events(file_path: str) -> pd.DataFrame:
     """
     Load major oil market events from CSV file.
     
+    Parsed files are cached by path, modification time and size, so
+    repeated loads of an unchanged file skip the CSV parse.
+    
     Parameters
     ----------
     file_path : str
@@ -65,16 +166,114 @@ def load_events(file_path: str) -> pd.DataFrame:
     FileNotFoundError
         If the file doesn't exist
     """
-    if not Path(file_path).exists():
+    path = Path(file_path)
+    if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
     
+    # Copy so callers can't mutate the cached frame
+    stat = path.stat()
+    return _load_events_cached(
+        str(path.resolve()), stat.st_mtime_ns, stat.st_size
+    ).copy()
+
+
+@lru_cache(maxsize=8)
+def _load_events_cached(file_path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """
+    Parse an events CSV, memoized on path, modification time and size.
+    """
     df = pd.read_csv(file_path)
-    df['Date'] = pd.to_datetime(df['Date'])
+    # ISO8601 fast path; cache decodes each unique date once
+    df['Date'] = pd.to_datetime(df['Date'], format='ISO8601', cache=True)
     df = df.sort_values('Date').reset_index(drop=True)
     
     return df
 
 
+def _float_values(values: pd.Series) -> np.ndarray:
+    """
+    NumPy view of a column as float32 or float64.
+    
+    float32 columns stay float32; everything else, including nullable and
+    Arrow-backed dtypes, becomes float64 with missing values as NaN.
+    """
+    dtype = np.float32 if values.dtype == np.float32 else np.float64
+    return values.to_numpy(dtype=dtype, na_value=np.nan)
+
+
+@njit
+def _rolling_std_update(
+    x: np.ndarray,
+    i: int,
+    window: int,
+    nobs: int,
+    mean: float,
+    m2: float,
+    bad_count: int
+):
+    """
+    Slide a Welford accumulator to the window ending at ``x[i]`` and return its std.
+    
+    ``nobs``, ``mean`` and ``m2`` are the count, mean and sum of squared
+    deviations of the window's finite values; ``bad_count`` counts its
+    NaN/±inf values, which are kept out of the accumulator. Adding and
+    removing values via the running mean, rather than raw sums of squares,
+    keeps precision when the level is large relative to the spread. Windows
+    that are incomplete or contain a non-finite value yield NaN, matching
+    ``Series.rolling(window).std()``.
+    
+    Returns
+    -------
+    tuple
+        (std, nobs, mean, m2, bad_count) after the update
+    """
+    v = x[i]
+    if np.isfinite(v):
+        nobs += 1
+        delta = v - mean
+        mean += delta / nobs
+        m2 += delta * (v - mean)
+    else:
+        bad_count += 1
+    if i >= window:
+        old = x[i - window]
+        if not np.isfinite(old):
+            bad_count -= 1
+        elif nobs == 1:
+            nobs = 0
+            mean = 0.0
+            m2 = 0.0
+        else:
+            nobs -= 1
+            delta = old - mean
+            mean -= delta / nobs
+            m2 -= delta * (old - mean)
+    if i < window - 1 or bad_count > 0:
+        return np.nan, nobs, mean, m2, bad_count
+    # Clamp rounding noise below zero
+    if m2 < 0.0:
+        m2 = 0.0
+    return np.sqrt(m2 / (window - 1)), nobs, mean, m2, bad_count
+
+
+# Compiled lazily on first call, so importing the module costs nothing.
+# Not cache=True: numba's on-disk cache records the importing module name,
+# so a cache written via ``data_processing`` breaks ``src.data_processing``.
+# error_model='numpy' gives IEEE results (inf/NaN) for a zero price instead
+# of raising ZeroDivisionError
+@njit(error_model='numpy')
+def _log_returns(prices: np.ndarray) -> np.ndarray:
+    """
+    Log returns of a price array, NaN in the first position.
+    """
+    out = np.empty_like(prices)
+    if prices.shape[0]:
+        out[0] = np.nan
+    for i in range(1, prices.shape[0]):
+        out[i] = np.log(prices[i] / prices[i - 1])
+    return out
+
+
 def calculate_log_returns(prices: pd.Series) -> pd.Series:
     """
     Calculate log returns from price series.
@@ -89,9 +288,15 @@ def calculate_log_returns(prices: pd.Series) -> pd.Series:
     pd.Series
         Log returns: log(price_t) - log(price_{t-1})
     """
-    log_prices = np.log(prices)
-    log_returns = log_prices.diff()
-    return log_returns
+    arr = _float_values(prices)
+    if _NUMBA_AVAILABLE:
+        out = _log_returns(arr)
+    else:
+        out = np.empty_like(arr)
+        out[:1] = np.nan
+        # log(p_t / p_{t-1}): one log call instead of two
+        out[1:] = np.log(arr[1:] / arr[:-1])
+    return pd.Series(out, index=prices.index, name=prices.name, copy=False)
 
 
 def calculate_simple_returns(prices: pd.Series) -> pd.Series:
@@ -108,7 +313,33 @@ def calculate_simple_returns(prices: pd.Series) -> pd.Series:
     pd.Series
         Simple returns: (price_t - price_{t-1}) / price_{t-1}
     """
-    return prices.pct_change()
+    arr = _float_values(prices)
+    out = np.empty_like(arr)
+    out[:1] = np.nan
+    # p_t / p_{t-1} - 1 in place, avoiding pct_change's shifted copy
+    np.divide(arr[1:], arr[:-1], out=out[1:])
+    out[1:] -= 1.0
+    return pd.Series(out, index=prices.index, name=prices.name, copy=False)
+
+
+@njit
+def _rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling sample standard deviation using a Welford accumulator.
+    
+    Each step adds the entering value and removes the leaving one, so
+    the cost is O(N) regardless of window size; see ``_rolling_std_update``.
+    """
+    out = np.empty_like(x)
+    nobs = 0
+    mean = 0.0
+    m2 = 0.0
+    bad_count = 0
+    for i in range(x.shape[0]):
+        out[i], nobs, mean, m2, bad_count = _rolling_std_update(
+            x, i, window, nobs, mean, m2, bad_count
+        )
+    return out
 
 
 def calculate_rolling_volatility(
@@ -130,7 +361,82 @@ def calculate_rolling_volatility(
     pd.Series
         Rolling volatility
     """
-    return returns.rolling(window=window).std()
+    arr = _float_values(returns)
+    if _NUMBA_AVAILABLE and window > 1:
+        values = _rolling_std(arr, window)
+    elif _BOTTLENECK_AVAILABLE and 1 < window <= len(arr):
+        # C implementation of the same moving std. An inf would
+        # poison its sums for good, while pandas only blanks the windows that
+        # contain it; as NaN it is skipped and min_count blanks those windows
+        inf_mask = np.isinf(arr)
+        if inf_mask.any():
+            arr = np.where(inf_mask, np.nan, arr)
+        values = bn.move_std(arr, window, min_count=window, ddof=1)
+    else:
+        # pandas widens float32 to float64; keep the dtype the other tiers give
+        values = pd.Series(arr, copy=False).rolling(window=window).std().to_numpy()
+        values = values.astype(arr.dtype, copy=False)
+    return pd.Series(values, index=returns.index, name=returns.name, copy=False)
+
+
+def _log_and_simple_returns(prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Log and simple returns sharing a single price-ratio computation.
+    
+    Parameters
+    ----------
+    prices : np.ndarray
+        Float price array
+        
+    Returns
+    -------
+    tuple of np.ndarray
+        Log returns and simple returns, each NaN in the first position
+    """
+    ratio = prices[1:] / prices[:-1]
+    log_returns = np.empty_like(prices)
+    simple_returns = np.empty_like(prices)
+    log_returns[:1] = np.nan
+    simple_returns[:1] = np.nan
+    np.log(ratio, out=log_returns[1:])
+    np.subtract(ratio, 1.0, out=simple_returns[1:])
+    return log_returns, simple_returns
+
+
+@njit(error_model='numpy')
+def _returns_and_volatility(prices: np.ndarray, window: int, simple: bool, vol: bool):
+    """
+    Log returns and, on request, simple returns and rolling volatility in one pass.
+    
+    Fused equivalent of ``calculate_log_returns``,
+    ``calculate_simple_returns`` and ``calculate_rolling_volatility``
+    (on the log returns), reading the price array only once. Outputs that
+    aren't requested come back empty.
+    """
+    n = prices.shape[0]
+    log_returns = np.empty_like(prices)
+    simple_returns = np.empty(n if simple else 0, dtype=prices.dtype)
+    volatility = np.empty(n if vol else 0, dtype=prices.dtype)
+    nobs = 0
+    mean = 0.0
+    m2 = 0.0
+    bad_count = 0
+    for i in range(n):
+        if i == 0:
+            log_returns[i] = np.nan
+            if simple:
+                simple_returns[i] = np.nan
+        else:
+            # One price ratio feeds both return types
+            ratio = prices[i] / prices[i - 1]
+            log_returns[i] = np.log(ratio)
+            if simple:
+                simple_returns[i] = ratio - 1.0
+        if vol:
+            volatility[i], nobs, mean, m2, bad_count = _rolling_std_update(
+                log_returns, i, window, nobs, mean, m2, bad_count
+            )
+    return log_returns, simple_returns, volatility
 
 
 def filter_date_range(
@@ -154,19 +460,42 @@ def filter_date_range(
     -------
     pd.DataFrame
         Filtered DataFrame
+        
+    Raises
+    ------
+    TypeError
+        If the index isn't a DatetimeIndex, or only one of the index and
+        a bound is timezone-aware
     """
-    if start_date:
-        df = df[df.index >= pd.Timestamp(start_date)]
-    if end_date:
-        df = df[df.index <= pd.Timestamp(end_date)]
-    return df
+    if not isinstance(df.index, pd.DatetimeIndex):
+        raise TypeError("DataFrame must have a DatetimeIndex")
+    
+    # Convert each bound once and compare against the index itself, which
+    # handles bounds outside its unit's range and rejects tz mismatches
+    start = pd.Timestamp(start_date) if start_date else None
+    end = pd.Timestamp(end_date) if end_date else None
+    
+    if not df.index.is_monotonic_increasing:
+        mask = np.ones(len(df), dtype=bool)
+        if start_date:
+            mask &= df.index >= start
+        if end_date:
+            mask &= df.index <= end
+        return df[mask]
+    
+    # Sorted index: binary-search the bounds and slice instead of masking
+    lo = df.index.searchsorted(start, side='left') if start_date else 0
+    hi = df.index.searchsorted(end, side='right') if end_date else len(df)
+    return df.iloc[lo:hi]
 
 
 def prepare_modeling_data(
     price_file: str,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    calculate_returns: bool = True
+    returns: Tuple[str, ...] = ('log', 'vol'),
+    chunksize: Optional[int] = None,
+    cache_parquet: Optional[str] = None
 ) -> pd.DataFrame:
     """
     Prepare complete dataset for modeling.
@@ -179,27 +508,298 @@ def prepare_modeling_data(
         Start date for filtering
     end_date : str, optional
         End date for filtering
-    calculate_returns : bool, optional
-        Whether to calculate log returns (default: True)
+    returns : tuple of str, optional
+        Return columns to add: 'log' (Log_Returns), 'simple'
+        (Simple_Returns) and/or 'vol' (Volatility_30d, the 30-day rolling
+        std of log returns). Only the requested columns are computed; pass
+        an empty tuple for prices only (default: ('log', 'vol'))
+    chunksize : int, optional
+        Read the CSV this many rows at a time, keeping only rows inside the
+        date range, so memory is bounded by the filtered result rather than
+        the whole file (default: None, read everything at once)
+    cache_parquet : str, optional
+        Parquet file holding the prepared dataset (requires pyarrow). It is
+        read instead of reprocessing the CSV when it was built from the same
+        ``price_file`` (path, modification time and size) with the same
+        date range and return columns; otherwise the dataset is rebuilt and
+        written there (default: None)
         
     Returns
     -------
     pd.DataFrame
         Prepared dataset with prices and optionally returns
+        
+    Raises
+    ------
+    FileNotFoundError
+        If ``price_file`` doesn't exist
+    ValueError
+        If ``returns`` names an unknown column
     """
-    df = load_brent_prices(price_file)
+    unknown = set(returns) - {'log', 'simple', 'vol'}
+    if unknown:
+        raise ValueError(f"Unknown return columns: {sorted(unknown)}")
+    if not Path(price_file).exists():
+        raise FileNotFoundError(f"File not found: {price_file}")
+    
+    if cache_parquet:
+        if not _PYARROW_AVAILABLE:
+            raise ImportError("cache_parquet requires pyarrow")
+        
+        stat = Path(price_file).stat()
+        cache_key = json.dumps({
+            'price_file': str(Path(price_file).resolve()),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'start_date': start_date,
+            'end_date': end_date,
+            'returns': sorted(set(returns))
+        }, default=str, sort_keys=True).encode()
+        cached = _read_parquet_cache(cache_parquet, price_file, cache_key)
+        if cached is not None:
+            return cached
+    
+    if chunksize:
+        reader = pd.read_csv(
+            price_file,
+            chunksize=chunksize,
+            dtype=_PRICE_CSV_DTYPES
+        )
+        df = pd.concat(
+            filter_date_range(_index_by_date(chunk), start_date, end_date)
+            for chunk in reader
+        )
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+    else:
+        df = load_brent_prices(price_file)
+        
+        if start_date or end_date:
+            df = filter_date_range(df, start_date, end_date)
     
-    if start_date or end_date:
-        df = filter_date_range(df, start_date, end_date)
+    # Returns need cross-chunk context, so compute them on the combined frame
+    if returns:
+        prices = _float_values(df['Price'])
+        simple = 'simple' in returns
+        vol = 'vol' in returns
+        if _NUMBA_AVAILABLE:
+            log_returns, simple_returns, volatility = _returns_and_volatility(
+                prices, 30, simple, vol
+            )
+        else:
+            if simple:
+                log_returns, simple_returns = _log_and_simple_returns(prices)
+            else:
+                log_returns = calculate_log_returns(df['Price']).to_numpy()
+            if vol:
+                volatility = calculate_rolling_volatility(
+                    pd.Series(log_returns, copy=False), window=30
+                ).to_numpy()
+        # Wrap the fresh outputs so assignment doesn't copy them again
+        if 'log' in returns:
+            df['Log_Returns'] = pd.Series(log_returns, index=df.index, copy=False)
+        if simple:
+            df['Simple_Returns'] = pd.Series(simple_returns, index=df.index, copy=False)
+        if vol:
+            df['Volatility_30d'] = pd.Series(volatility, index=df.index, copy=False)
     
-    if calculate_returns:
-        df['Log_Returns'] = calculate_log_returns(df['Price'])
-        df['Simple_Returns'] = calculate_simple_returns(df['Price'])
-        df['Volatility_30d'] = calculate_rolling_volatility(df['Log_Returns'], window=30)
+    if cache_parquet:
+        # Key goes in the Arrow schema metadata; DataFrame.attrs only reach
+        # Parquet from pandas 2.1
+        table = pa.Table.from_pandas(df)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_PARQUET_CACHE_KEY] = cache_key
+        # Write beside the target and rename over it, so an interrupted run
+        # never leaves a partial cache file behind
+        tmp_path = f'{cache_parquet}.{os.getpid()}.tmp'
+        try:
+            pq.write_table(
+                table.replace_schema_metadata(metadata), tmp_path, compression='zstd'
+            )
+            os.replace(tmp_path, cache_parquet)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
     
     return df
 
 
+def _read_parquet_cache(
+    cache_parquet: str,
+    price_file: str,
+    cache_key: bytes
+) -> Optional[pd.DataFrame]:
+    """
+    Read a dataset cached by ``prepare_modeling_data`` if it is still valid.
+    
+    Parameters
+    ----------
+    cache_parquet : str
+        Path to the Parquet cache file
+    price_file : str
+        Path to the price CSV the cache was built from
+    cache_key : bytes
+        Serialized price file identity and arguments the cached dataset
+        must have been prepared with
+        
+    Returns
+    -------
+    pd.DataFrame or None
+        Cached dataset, or None if it is missing, unreadable, older than
+        the CSV or built from a different file or with different arguments
+    """
+    cache = Path(cache_parquet)
+    if not cache.exists():
+        return None
+    if cache.stat().st_mtime_ns < Path(price_file).stat().st_mtime_ns:
+        return None
+    
+    # Check the key from the footer before reading any column data. A file
+    # that isn't readable Parquet is treated as a miss and rebuilt
+    try:
+        metadata = pq.read_schema(cache).metadata or {}
+        if metadata.get(_PARQUET_CACHE_KEY) != cache_key:
+            return None
+        return pq.read_table(cache).to_pandas()
+    except (OSError, pa.ArrowException):
+        return None
+
+
+@njit
+def _summary_moments(x: np.ndarray):
+    """
+    Count, NaN count, mean, central moment sums M2-M4, min and max in one pass.
+    
+    Uses the Welford/Terriberry online update for the mean and the sums of
+    squared, cubed and fourth-power deviations; NaNs are skipped and counted.
+    Infinite values count towards the total, min and max but are kept out of
+    the update; as in pandas, they make the mean ±inf (NaN if both signs
+    occur) and M2-M4 NaN.
+    """
+    count = 0
+    nan_count = 0
+    finite = 0
+    pos_inf = False
+    neg_inf = False
+    mean = 0.0
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    lo = np.inf
+    hi = -np.inf
+    for i in range(x.shape[0]):
+        v = x[i]
+        if np.isnan(v):
+            nan_count += 1
+            continue
+        count += 1
+        if v < lo:
+            lo = v
+        if v > hi:
+            hi = v
+        if np.isinf(v):
+            if v > 0:
+                pos_inf = True
+            else:
+                neg_inf = True
+            continue
+        prev = finite
+        finite += 1
+        delta = v - mean
+        delta_n = delta / finite
+        delta_n2 = delta_n * delta_n
+        term = delta * delta_n * prev
+        mean += delta_n
+        m4 += (
+            term * delta_n2 * (finite * finite - 3 * finite + 3)
+            + 6.0 * delta_n2 * m2
+            - 4.0 * delta_n * m3
+        )
+        m3 += term * delta_n * (finite - 2) - 3.0 * delta_n * m2
+        m2 += term
+    if count == 0:
+        return count, nan_count, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan
+    if pos_inf or neg_inf:
+        if pos_inf and neg_inf:
+            mean = np.nan
+        else:
+            mean = np.inf if pos_inf else -np.inf
+        m2 = m3 = m4 = np.nan
+    return count, nan_count, mean, m2, m3, m4, lo, hi
+
+
+def _stored_float(value: float, dtype: np.dtype) -> float:
+    """
+    Convert a value stored in a column of ``dtype`` to a Python float.
+    
+    float32 values are widened through the shortest decimal that round-trips
+    in float32, so a stored price of 9.1 reports as 9.1 rather than
+    9.100000381469727. Only use this for values taken from the column (min,
+    max, median), not for statistics accumulated in float64.
+    """
+    if dtype == np.float32:
+        return float(np.format_float_positional(np.float32(value), unique=True))
+    return float(value)
+
+
+def _column_stats(values: pd.Series) -> dict:
+    """
+    Missing count, mean, sample std, skewness, kurtosis, min and max of a column.
+    
+    Skewness and excess kurtosis use the same bias-corrected estimators as
+    ``Series.skew`` and ``Series.kurtosis``.
+    
+    Parameters
+    ----------
+    values : pd.Series
+        Numeric column
+        
+    Returns
+    -------
+    dict
+        Statistics keyed by 'missing', 'mean', 'std', 'skewness',
+        'kurtosis', 'min' and 'max'
+    """
+    arr = _float_values(values)
+    if not _NUMBA_AVAILABLE:
+        # Accumulate in float64 like the numba path; pandas sums float32 in float32
+        series = pd.Series(arr, dtype=np.float64, copy=False)
+        return {
+            'missing': int(series.isna().sum()),
+            'mean': float(series.mean()),
+            'std': float(series.std()),
+            'skewness': float(series.skew()),
+            'kurtosis': float(series.kurtosis()),
+            'min': _stored_float(series.min(), arr.dtype),
+            'max': _stored_float(series.max(), arr.dtype)
+        }
+    
+    n, missing, mean, m2, m3, m4, lo, hi = _summary_moments(arr)
+    
+    skewness = np.nan
+    if n > 2:
+        skewness = 0.0 if m2 == 0 else (
+            np.sqrt(n * (n - 1)) / (n - 2) * np.sqrt(n) * m3 / m2 ** 1.5
+        )
+    kurtosis = np.nan
+    if n > 3:
+        kurtosis = 0.0 if m2 == 0 else (
+            n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2)
+            - 3.0 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+        )
+    
+    return {
+        'missing': missing,
+        'mean': float(mean),
+        'std': float(np.sqrt(m2 / (n - 1))) if n > 1 else np.nan,
+        'skewness': float(skewness),
+        'kurtosis': float(kurtosis),
+        'min': _stored_float(lo, arr.dtype),
+        'max': _stored_float(hi, arr.dtype)
+    }
+
+
 def get_data_summary(df: pd.DataFrame) -> dict:
     """
     Get summary statistics for the dataset.
@@ -214,6 +814,14 @@ def get_data_summary(df: pd.DataFrame) -> dict:
     dict
         Dictionary with summary statistics
     """
+    price_stats = _column_stats(df['Price'])
+    
+    # np.median selects with a partition rather than a full sort
+    prices = _float_values(df['Price'])
+    if price_stats['missing']:
+        prices = prices[~np.isnan(prices)]
+    median = _stored_float(np.median(prices) if len(prices) else np.nan, prices.dtype)
+    
     summary = {
         'n_observations': len(df),
         'date_range': {
@@ -221,21 +829,22 @@ def get_data_summary(df: pd.DataFrame) -> dict:
             'end': df.index.max()
         },
         'price_stats': {
-            'mean': df['Price'].mean(),
-            'median': df['Price'].median(),
-            'std': df['Price'].std(),
-            'min': df['Price'].min(),
-            'max': df['Price'].max()
+            'mean': price_stats['mean'],
+            'median': median,
+            'std': price_stats['std'],
+            'min': price_stats['min'],
+            'max': price_stats['max']
         },
-        'missing_values': df['Price'].isna().sum()
+        'missing_values': price_stats['missing']
     }
     
     if 'Log_Returns' in df.columns:
+        returns_stats = _column_stats(df['Log_Returns'])
         summary['returns_stats'] = {
-            'mean': df['Log_Returns'].mean(),
-            'std': df['Log_Returns'].std(),
-            'skewness': df['Log_Returns'].skew(),
-            'kurtosis': df['Log_Returns'].kurtosis()
+            'mean': returns_stats['mean'],
+            'std': returns_stats['std'],
+            'skewness': returns_stats['skewness'],
+            'kurtosis': returns_stats['kurtosis']
         }
     
     return summary
@@ -6,19 +6,23 @@ import pytest
 import pandas as pd
 import numpy as np
 from pathlib import Path
-import sys
+import importlib.util
+import os
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+import src.data_processing as data_processing
 
-from data_processing import (
+from src.data_processing import (
     load_brent_prices,
     load_events,
     calculate_log_returns,
     calculate_simple_returns,
     calculate_rolling_volatility,
     filter_date_range,
-    get_data_summary
+    prepare_modeling_data,
+    get_data_summary,
+    _rolling_std,
+    _log_and_simple_returns,
+    _returns_and_volatility
 )
 
 
@@ -45,6 +49,30 @@ def sample_price_csv(tmp_path):
     return str(csv_file)
 
 
+@pytest.fixture(params=['numba', 'numpy'])
+def kernel_tier(request, monkeypatch):
+    """Run a test with the numba kernels and again with the NumPy/pandas fallback."""
+    if request.param == 'numpy':
+        monkeypatch.setattr(data_processing, '_NUMBA_AVAILABLE', False)
+    elif not data_processing._NUMBA_AVAILABLE:
+        pytest.skip("numba not installed")
+    return request.param
+
+
+@pytest.fixture(params=['numba', 'bottleneck', 'pandas'])
+def volatility_tier(request, monkeypatch):
+    """Run a test against each rolling-volatility implementation."""
+    if request.param == 'numba' and not data_processing._NUMBA_AVAILABLE:
+        pytest.skip("numba not installed")
+    if request.param != 'numba':
+        monkeypatch.setattr(data_processing, '_NUMBA_AVAILABLE', False)
+    if request.param == 'bottleneck' and not data_processing._BOTTLENECK_AVAILABLE:
+        pytest.skip("bottleneck not installed")
+    if request.param == 'pandas':
+        monkeypatch.setattr(data_processing, '_BOTTLENECK_AVAILABLE', False)
+    return request.param
+
+
 @pytest.fixture
 def sample_events_csv(tmp_path):
     """Create a temporary CSV file with sample events."""
@@ -71,6 +99,7 @@ class TestLoadBrentPrices:
         assert isinstance(df, pd.DataFrame)
         assert isinstance(df.index, pd.DatetimeIndex)
         assert 'Price' in df.columns
+        assert df['Price'].dtype == np.float32
         assert len(df) == 5
     
     def test_file_not_found(self):
@@ -86,7 +115,16 @@ class TestLoadBrentPrices:
         
         with pytest.raises(ValueError):
             load_brent_prices(str(csv_file))
-    
+
+    def test_invalid_date_format(self, tmp_path):
+        """Test error when dates don't match the expected format."""
+        csv_file = tmp_path / "bad_dates.csv"
+        df = pd.DataFrame({'Date': ['2020-01-01', '2020-01-02'], 'Price': [60, 61]})
+        df.to_csv(csv_file, index=False)
+
+        with pytest.raises(ValueError):
+            load_brent_prices(str(csv_file))
+
     def test_date_sorting(self, tmp_path):
         """Test that dates are sorted correctly."""
         csv_file = tmp_path / "unsorted.csv"
@@ -100,6 +138,23 @@ class TestLoadBrentPrices:
         result = load_brent_prices(str(csv_file))
         assert result.index[0] < result.index[-1]  # Ascending order
 
+    def test_repeated_load_is_isolated(self, sample_price_csv):
+        """Test cached loads aren't affected by caller mutation."""
+        first = load_brent_prices(sample_price_csv)
+        first['Price'] = 0.0
+
+        second = load_brent_prices(sample_price_csv)
+        assert (second['Price'] > 0).all()
+
+    def test_reload_after_file_change(self, sample_price_csv):
+        """Test that an edited file is re-read rather than served from cache."""
+        assert len(load_brent_prices(sample_price_csv)) == 5
+
+        with open(sample_price_csv, 'a') as f:
+            f.write('06-Jan-20,64.0\n')
+
+        assert len(load_brent_prices(sample_price_csv)) == 6
+
 
 class TestLoadEvents:
     """Tests for load_events function."""
@@ -111,6 +166,7 @@ class TestLoadEvents:
         assert isinstance(df, pd.DataFrame)
         assert 'Date' in df.columns
         assert 'Event_Name' in df.columns
+        assert pd.api.types.is_datetime64_any_dtype(df['Date'])
         assert len(df) == 2
     
     def test_events_file_not_found(self):
@@ -150,6 +206,38 @@ class TestCalculateReturns:
         assert np.isclose(returns.iloc[1], expected_1)
         assert np.isclose(returns.iloc[2], expected_2)
 
+    def test_simple_returns_values(self):
+        """Test simple returns with known values."""
+        prices = pd.Series([100, 110, 99])
+        returns = calculate_simple_returns(prices)
+
+        assert np.isclose(returns.iloc[1], 0.10)
+        assert np.isclose(returns.iloc[2], -0.10)
+
+    def test_shared_ratio_returns(self, sample_price_data):
+        """Test shared-ratio helper against the individual functions."""
+        prices = sample_price_data['Price']
+        log_returns, simple_returns = _log_and_simple_returns(prices.to_numpy())
+
+        np.testing.assert_allclose(
+            log_returns, calculate_log_returns(prices), equal_nan=True
+        )
+        np.testing.assert_allclose(
+            simple_returns, calculate_simple_returns(prices), equal_nan=True
+        )
+
+    def test_nullable_and_object_inputs(self):
+        """Test that nullable and object price series are accepted."""
+        expected = calculate_log_returns(pd.Series([100.0, 110.0, np.nan, 99.0]))
+
+        for dtype in ('Float64', object):
+            prices = pd.Series([100.0, 110.0, None, 99.0], dtype=dtype)
+            np.testing.assert_allclose(
+                calculate_log_returns(prices), expected, equal_nan=True
+            )
+            assert len(calculate_simple_returns(prices)) == 4
+            assert len(calculate_rolling_volatility(prices, window=2)) == 4
+
 
 class TestCalculateVolatility:
     """Tests for volatility calculation."""
@@ -175,6 +263,82 @@ class TestCalculateVolatility:
         # 30-day volatility should be smoother (fewer non-NaN values)
         assert vol_10.notna().sum() > vol_30.notna().sum()
 
+    def test_rolling_volatility_matches_pandas(self, sample_price_data, volatility_tier):
+        """Test each volatility implementation against pandas rolling std."""
+        returns = calculate_log_returns(sample_price_data['Price'])
+        returns.iloc[40] = np.nan
+        returns.iloc[60] = np.inf
+        returns.iloc[75] = -np.inf
+
+        volatility = calculate_rolling_volatility(returns, window=10)
+        expected = returns.rolling(window=10).std()
+
+        np.testing.assert_allclose(volatility, expected, equal_nan=True)
+        assert volatility.notna().iloc[-1]
+
+    def test_rolling_volatility_keeps_float32(self, sample_price_data, volatility_tier):
+        """Test that every implementation returns float32 for float32 input."""
+        returns = calculate_log_returns(sample_price_data['Price'].astype(np.float32))
+
+        volatility = calculate_rolling_volatility(returns, window=10)
+        assert volatility.dtype == np.float32
+
+    def test_rolling_std_matches_pandas(self, sample_price_data):
+        """Test Welford kernel against pandas rolling std."""
+        returns = calculate_log_returns(sample_price_data['Price'])
+        returns.iloc[40] = np.nan
+
+        result = _rolling_std(returns.to_numpy(), 10)
+        expected = returns.rolling(window=10).std().to_numpy()
+
+        np.testing.assert_allclose(result, expected, equal_nan=True)
+
+    def test_rolling_volatility_large_level(self, volatility_tier):
+        """Test precision when the level is large relative to the spread."""
+        rng = np.random.default_rng(0)
+        values = pd.Series(1e6 + rng.normal(0, 1e-3, size=500))
+
+        volatility = calculate_rolling_volatility(values, window=30)
+        windows = np.lib.stride_tricks.sliding_window_view(values.to_numpy(), 30)
+        expected = np.concatenate([np.full(29, np.nan), windows.std(axis=1, ddof=1)])
+
+        np.testing.assert_allclose(volatility, expected, rtol=1e-4, equal_nan=True)
+
+    def test_rolling_std_recovers_after_inf(self):
+        """Test that an infinite return only blanks the windows containing it."""
+        returns = pd.Series([0.01, -0.02, np.inf, 0.01, 0.03, -0.01, 0.02, -np.inf, 0.0])
+
+        result = _rolling_std(returns.to_numpy(), 3)
+        expected = returns.rolling(window=3).std().to_numpy()
+
+        np.testing.assert_allclose(result, expected, equal_nan=True)
+        assert not np.isnan(result[5])
+
+    def test_fused_kernel_matches_separate_calls(self, sample_price_data):
+        """Test fused returns/volatility kernel against the public functions."""
+        prices = sample_price_data['Price']
+        log_returns, simple_returns, volatility = _returns_and_volatility(
+            prices.to_numpy(), 10, True, True
+        )
+
+        expected_log = calculate_log_returns(prices)
+        np.testing.assert_allclose(log_returns, expected_log, equal_nan=True)
+        np.testing.assert_allclose(
+            simple_returns, calculate_simple_returns(prices), equal_nan=True
+        )
+        np.testing.assert_allclose(
+            volatility, expected_log.rolling(window=10).std(), equal_nan=True
+        )
+
+    def test_fused_kernel_recovers_after_zero_price(self):
+        """Test fused volatility after a -inf log return from a zero price."""
+        prices = np.array([50.0, 51.0, 0.0, 52.0, 53.0, 52.5, 54.0, 53.0, 55.0])
+        log_returns, _, volatility = _returns_and_volatility(prices, 3, False, True)
+
+        expected = pd.Series(log_returns).rolling(window=3).std().to_numpy()
+        np.testing.assert_allclose(volatility, expected, equal_nan=True)
+        assert not np.isnan(volatility[-1])
+
 
 class TestFilterDateRange:
     """Tests for date filtering."""
@@ -210,6 +374,63 @@ class TestFilterDateRange:
         assert filtered.index.min() >= pd.Timestamp('2020-02-01')
         assert filtered.index.max() <= pd.Timestamp('2020-03-01')
 
+    def test_filter_accepts_timestamp_strings(self, sample_price_data):
+        """Test bounds in any format pd.Timestamp understands."""
+        expected = filter_date_range(
+            sample_price_data, start_date='2020-02-01', end_date='2020-03-01'
+        )
+
+        for start, end in [('2020/02/01', '2020/03/01'), ('Feb 1, 2020', 'Mar 1, 2020')]:
+            filtered = filter_date_range(sample_price_data, start_date=start, end_date=end)
+            pd.testing.assert_frame_equal(filtered, expected)
+
+    def test_filter_requires_datetime_index(self, sample_price_data):
+        """Test error when the index isn't a DatetimeIndex."""
+        with pytest.raises(TypeError):
+            filter_date_range(sample_price_data.reset_index(), start_date='2020-02-01')
+
+    def test_filter_unsorted_index(self, sample_price_data):
+        """Test filtering when the index isn't chronological."""
+        shuffled = sample_price_data.iloc[::-1]
+        filtered = filter_date_range(
+            shuffled,
+            start_date='2020-02-01',
+            end_date='2020-03-01'
+        )
+
+        assert len(filtered) == 30
+        assert filtered.index.min() == pd.Timestamp('2020-02-01')
+        assert filtered.index.max() == pd.Timestamp('2020-03-01')
+
+    def test_filter_out_of_range_bounds(self, sample_price_data):
+        """Test bounds outside the index's datetime range keep every row."""
+        shuffled = sample_price_data.iloc[::-1]
+        for df in [sample_price_data, shuffled]:
+            for start, end in [('1000-01-01', None), (None, '9999-12-31'),
+                               ('1500-01-01', '2500-01-01')]:
+                filtered = filter_date_range(df, start_date=start, end_date=end)
+                assert len(filtered) == len(df)
+
+    def test_filter_tz_aware_index(self, sample_price_data):
+        """Test tz-aware bounds on a tz-aware index and errors on a mismatch."""
+        aware = sample_price_data.tz_localize('US/Eastern')
+        filtered = filter_date_range(
+            aware,
+            start_date=pd.Timestamp('2020-02-01', tz='US/Eastern'),
+            end_date=pd.Timestamp('2020-03-01', tz='US/Eastern')
+        )
+
+        assert filtered.index.min() == pd.Timestamp('2020-02-01', tz='US/Eastern')
+        assert filtered.index.max() == pd.Timestamp('2020-03-01', tz='US/Eastern')
+
+        for df in [aware, aware.iloc[::-1]]:
+            with pytest.raises(TypeError):
+                filter_date_range(df, start_date='2020-02-01')
+        with pytest.raises(TypeError):
+            filter_date_range(
+                sample_price_data, start_date=pd.Timestamp('2020-02-01', tz='UTC')
+            )
+
 
 class TestGetDataSummary:
     """Tests for data summary function."""
@@ -238,6 +459,70 @@ class TestGetDataSummary:
         assert 'skewness' in summary['returns_stats']
         assert 'kurtosis' in summary['returns_stats']
 
+    def test_summary_matches_pandas(self, sample_price_data, kernel_tier):
+        """Test summary statistics against pandas reductions."""
+        sample_price_data.iloc[5, 0] = np.nan
+        prices = sample_price_data['Price']
+
+        summary = get_data_summary(sample_price_data)
+        stats = summary['price_stats']
+
+        assert summary['missing_values'] == 1
+        assert np.isclose(stats['mean'], prices.mean())
+        assert np.isclose(stats['median'], prices.median())
+        assert np.isclose(stats['std'], prices.std())
+        assert stats['min'] == prices.min()
+        assert stats['max'] == prices.max()
+
+    def test_float32_summary_reports_stored_values(self, sample_price_csv, kernel_tier):
+        """Test that float32 prices report their decimal values."""
+        stats = get_data_summary(load_brent_prices(sample_price_csv))['price_stats']
+
+        assert stats['min'] == 59.8
+        assert stats['max'] == 63.5
+        assert stats['median'] == 61.2
+
+    def test_float32_summary_keeps_float64_moments(self, sample_price_csv, kernel_tier):
+        """Test that float32 prices don't round accumulated statistics."""
+        df = load_brent_prices(sample_price_csv)
+        prices = df['Price'].astype(np.float64)
+
+        stats = get_data_summary(df)['price_stats']
+
+        assert np.isclose(stats['mean'], prices.mean(), rtol=1e-14)
+        assert np.isclose(stats['std'], prices.std(), rtol=1e-12)
+
+    def test_returns_summary_matches_pandas(self, sample_price_data, kernel_tier):
+        """Test returns moments against pandas skew and kurtosis."""
+        returns = calculate_log_returns(sample_price_data['Price'])
+        sample_price_data['Log_Returns'] = returns
+
+        stats = get_data_summary(sample_price_data)['returns_stats']
+
+        assert np.isclose(stats['mean'], returns.mean())
+        assert np.isclose(stats['std'], returns.std())
+        assert np.isclose(stats['skewness'], returns.skew())
+        assert np.isclose(stats['kurtosis'], returns.kurtosis())
+
+    @pytest.mark.filterwarnings('ignore::RuntimeWarning')
+    def test_summary_with_infinite_values(self, kernel_tier):
+        """Test that infinite values give the same statistics as pandas."""
+        dates = pd.date_range('2020-01-01', periods=5, freq='D')
+        for values in ([1.0, 2.0, np.inf, 3.0, 4.0], [1.0, -np.inf, 3.0, np.inf, 5.0]):
+            df = pd.DataFrame({'Price': values, 'Log_Returns': values}, index=dates)
+            returns = df['Log_Returns']
+
+            summary = get_data_summary(df)
+            prices = summary['price_stats']
+            moments = summary['returns_stats']
+
+            np.testing.assert_equal(prices['mean'], df['Price'].mean())
+            np.testing.assert_equal(prices['std'], df['Price'].std())
+            assert prices['min'] == df['Price'].min()
+            assert prices['max'] == df['Price'].max()
+            np.testing.assert_equal(moments['skewness'], returns.skew())
+            np.testing.assert_equal(moments['kurtosis'], returns.kurtosis())
+
 
 class TestIntegration:
     """Integration tests for combined functionality."""
@@ -259,3 +544,137 @@ class TestIntegration:
         
         assert summary['n_observations'] == 4  # 5 days - 1 filtered
         assert 'returns_stats' in summary
+
+    def test_chunked_preparation_matches_full_read(self, tmp_path):
+        """Test chunked reading gives the same result as a full read."""
+        csv_file = tmp_path / "prices.csv"
+        dates = pd.date_range('2020-01-01', periods=60, freq='D')
+        df = pd.DataFrame({
+            'Date': dates.strftime('%d-%b-%y'),
+            'Price': np.random.uniform(50, 100, size=60)
+        })
+        df.to_csv(csv_file, index=False)
+
+        full = prepare_modeling_data(
+            str(csv_file), start_date='2020-01-10', end_date='2020-02-20'
+        )
+        chunked = prepare_modeling_data(
+            str(csv_file), start_date='2020-01-10', end_date='2020-02-20',
+            chunksize=7
+        )
+
+        pd.testing.assert_frame_equal(chunked, full)
+
+    def test_parquet_cache_round_trip(self, sample_price_csv, tmp_path, monkeypatch):
+        """Test that a matching cache is read instead of rebuilding."""
+        pytest.importorskip('pyarrow')
+        cache_file = str(tmp_path / "prepared.parquet")
+
+        first = prepare_modeling_data(
+            sample_price_csv, returns=('vol', 'log'), cache_parquet=cache_file
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("cache was not used")
+
+        monkeypatch.setattr(data_processing, 'load_brent_prices', fail)
+        cached = prepare_modeling_data(
+            sample_price_csv, returns=('log', 'vol'), cache_parquet=cache_file
+        )
+        pd.testing.assert_frame_equal(cached, first)
+
+    def test_parquet_cache_rebuilds_for_other_inputs(self, sample_price_csv, tmp_path):
+        """Test that a cache isn't reused for other arguments or files."""
+        pytest.importorskip('pyarrow')
+        cache_file = str(tmp_path / "prepared.parquet")
+        prepare_modeling_data(sample_price_csv, cache_parquet=cache_file)
+
+        filtered = prepare_modeling_data(
+            sample_price_csv, start_date='2020-01-03', cache_parquet=cache_file
+        )
+        assert len(filtered) == 3
+
+        other_csv = tmp_path / "other_prices.csv"
+        pd.DataFrame({
+            'Date': ['01-Jan-20', '02-Jan-20'], 'Price': [1000.0, 1010.0]
+        }).to_csv(other_csv, index=False)
+        other = prepare_modeling_data(str(other_csv), cache_parquet=cache_file)
+        assert other['Price'].iloc[0] == 1000.0
+
+    def test_parquet_cache_rebuilds_when_csv_is_newer(
+        self, sample_price_csv, tmp_path, monkeypatch
+    ):
+        """Test that a cache older than the CSV is rebuilt."""
+        pytest.importorskip('pyarrow')
+        cache_file = str(tmp_path / "prepared.parquet")
+        prepare_modeling_data(sample_price_csv, cache_parquet=cache_file)
+
+        stat = os.stat(cache_file)
+        os.utime(sample_price_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        calls = []
+        load = data_processing.load_brent_prices
+        monkeypatch.setattr(
+            data_processing, 'load_brent_prices',
+            lambda path: calls.append(path) or load(path)
+        )
+        prepare_modeling_data(sample_price_csv, cache_parquet=cache_file)
+        assert calls == [sample_price_csv]
+
+    def test_parquet_cache_rebuilds_unreadable_file(self, sample_price_csv, tmp_path):
+        """Test that a truncated or non-Parquet cache file is rebuilt."""
+        pytest.importorskip('pyarrow')
+        cache_file = tmp_path / "prepared.parquet"
+        expected = prepare_modeling_data(sample_price_csv, cache_parquet=str(cache_file))
+        contents = cache_file.read_bytes()
+
+        for corrupt in (contents[:len(contents) // 2], b'not parquet'):
+            cache_file.write_bytes(corrupt)
+            rebuilt = prepare_modeling_data(sample_price_csv, cache_parquet=str(cache_file))
+            pd.testing.assert_frame_equal(rebuilt, expected)
+            assert cache_file.read_bytes() == contents
+
+        assert [p.name for p in tmp_path.iterdir() if p.suffix == '.tmp'] == []
+
+    def test_requested_return_columns(self, sample_price_csv, kernel_tier):
+        """Test that only the requested return columns are added."""
+        default = prepare_modeling_data(sample_price_csv)
+        assert list(default.columns) == ['Price', 'Log_Returns', 'Volatility_30d']
+
+        simple = prepare_modeling_data(sample_price_csv, returns=('simple',))
+        assert list(simple.columns) == ['Price', 'Simple_Returns']
+        assert (default.dtypes == np.float32).all()
+        assert (simple.dtypes == np.float32).all()
+
+        with pytest.raises(ValueError):
+            prepare_modeling_data(sample_price_csv, returns=('bogus',))
+
+    def test_fallback_matches_numba_path(self, sample_price_csv, monkeypatch):
+        """Test the no-numba branch gives the same columns, dtypes and values."""
+        if not data_processing._NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        returns = ('log', 'simple', 'vol')
+        fused = prepare_modeling_data(sample_price_csv, returns=returns)
+
+        monkeypatch.setattr(data_processing, '_NUMBA_AVAILABLE', False)
+        fallback = prepare_modeling_data(sample_price_csv, returns=returns)
+
+        pd.testing.assert_frame_equal(fallback, fused, rtol=1e-6)
+
+
+class TestModuleImport:
+    """Tests for importing the module."""
+
+    def test_import_under_either_name(self):
+        """Test the module works when imported as a package or from src/."""
+        path = Path(__file__).parent.parent / 'src' / 'data_processing.py'
+        spec = importlib.util.spec_from_file_location('data_processing', path)
+        plain = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(plain)
+
+        prices = pd.Series([100.0, 110.0, 105.0, 99.0])
+        for module in (data_processing, plain):
+            volatility = module.calculate_rolling_volatility(
+                module.calculate_log_returns(prices), window=2
+            )
+            assert volatility.notna().sum() == 2